@@ -3,6 +3,7 @@ set -euo pipefail
 
 INPUT=""
 OUTPUT=""
+FORMAT="legacy"
 
 while [[ $# -gt 0 ]]; do
   case "$1" in
@@ -14,6 +15,10 @@ while [[ $# -gt 0 ]]; do
       OUTPUT="$2"
       shift 2
       ;;
+    --format)
+      FORMAT="$2"
+      shift 2
+      ;;
     *)
       echo "Unknown argument: $1" >&2
       exit 1
@@ -22,8 +27,8 @@ while [[ $# -gt 0 ]]; do
 done
 
 if [[ -z "$INPUT" || -z "$OUTPUT" ]]; then
-  echo "Usage: $0 --input <path> --output <path>" >&2
+  echo "Usage: $0 --input <path> --output <path> [--format legacy|jsonl|npz|parquet]" >&2
   exit 1
 fi
 
-python3 -m src.cli --input "$INPUT" --output "$OUTPUT"
+python3 -m src.cli --input "$INPUT" --output "$OUTPUT" --format "$FORMAT"
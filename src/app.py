@@ -4,13 +4,17 @@ from __future__ import annotations
 
 from typing import Optional
 
-from flask import Flask, jsonify, render_template, request
+from flask import Flask, Response, jsonify, render_template, request
 
 from .cli import build_pipeline
+from .formats import COMPACT_FORMAT, LEGACY_FORMAT, compress, encode_triplets, supported_encodings
 from .pipeline import Pipeline
 
 _pipeline: Optional[Pipeline] = None
 
+# Responses smaller than this are not worth the compression overhead.
+_COMPRESS_MIN_BYTES = 1024
+
 
 def _get_pipeline() -> Pipeline:
     global _pipeline
@@ -36,13 +40,51 @@ def create_app() -> Flask:
                 400,
             )
 
+        output_format = payload.get("format", LEGACY_FORMAT)
+        if output_format not in (LEGACY_FORMAT, COMPACT_FORMAT):
+            return (
+                jsonify(
+                    {
+                        "error": f"Format must be '{LEGACY_FORMAT}' or '{COMPACT_FORMAT}'.",
+                        "triplets": [],
+                    }
+                ),
+                400,
+            )
+
         triplets = _get_pipeline().generate_triplets(text)
+        if output_format == COMPACT_FORMAT:
+            return jsonify(encode_triplets(triplets))
         return jsonify({"triplets": triplets})
 
     @app.get("/healthz")
     def healthcheck():  # pragma: no cover - trivial endpoint
         return jsonify({"status": "ok"})
 
+    @app.after_request
+    def compress_response(response: Response) -> Response:
+        if (
+            not request.path.startswith("/api/")
+            or response.direct_passthrough
+            or response.status_code < 200
+            or response.status_code >= 300
+            or "Content-Encoding" in response.headers
+        ):
+            return response
+
+        response.vary.add("Accept-Encoding")
+        body = response.get_data()
+        if len(body) < _COMPRESS_MIN_BYTES:
+            return response
+
+        encoding = request.accept_encodings.best_match(supported_encodings())
+        if encoding is None:
+            return response
+
+        response.set_data(compress(body, encoding))
+        response.headers["Content-Encoding"] = encoding
+        return response
+
     return app
 
 
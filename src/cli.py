@@ -7,6 +7,13 @@ from pathlib import Path
 from typing import Mapping, Optional, Sequence
 
 from .entities import SpacyEntityExtractor
+from .formats import (
+    LEGACY_FORMAT,
+    ensure_format_available,
+    write_jsonl,
+    write_npz,
+    write_parquet,
+)
 from .pipeline import Pipeline
 from .wikidata import WikidataClient
 
@@ -19,6 +26,8 @@ _REQUIRED_OUTPUT_KEYS = (
     "object_qid",
 )
 
+_OUTPUT_FORMATS = (LEGACY_FORMAT, "jsonl", "npz", "parquet")
+
 
 def build_pipeline() -> Pipeline:
     """Construct the default pipeline with real extractor and KG client."""
@@ -28,19 +37,40 @@ def build_pipeline() -> Pipeline:
     return Pipeline(entity_extractor=extractor, kg_client=kg_client)
 
 
-def run(input_path: str, output_path: str, pipeline: Optional[Pipeline] = None) -> None:
-    """Execute the pipeline with the provided input and persist JSON-line output."""
+def run(
+    input_path: str,
+    output_path: str,
+    pipeline: Optional[Pipeline] = None,
+    output_format: str = LEGACY_FORMAT,
+) -> None:
+    """Execute the pipeline with the provided input and persist the triplets.
+
+    *output_format* selects the legacy single-quoted lines, streaming JSONL, a
+    NumPy ``.npz`` edge list or a Parquet table.
+    """
+
+    if output_format not in _OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {output_format!r}")
+    # Fail before the (slow) pipeline runs if an optional writer is unavailable.
+    ensure_format_available(output_format)
 
     text = Path(input_path).read_text(encoding="utf-8")
 
     pipeline = pipeline or build_pipeline()
     triplets = pipeline.generate_triplets(text)
 
-    records = [_normalise_record(record) for record in triplets]
     # Ensure the parent folder exists to avoid surprising IOErrors.
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-    Path(output_path).write_text("\n".join(records), encoding="utf-8")
+    if output_format == "jsonl":
+        write_jsonl(triplets, output_path, _REQUIRED_OUTPUT_KEYS)
+    elif output_format == "npz":
+        write_npz(triplets, output_path)
+    elif output_format == "parquet":
+        write_parquet(triplets, output_path)
+    else:
+        records = [_normalise_record(record) for record in triplets]
+        Path(output_path).write_text("\n".join(records), encoding="utf-8")
 
 
 def _normalise_record(record: Mapping[str, object]) -> str:
@@ -59,14 +89,20 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Generate Wikidata triplets from text input.")
     parser.add_argument("--input", required=True, help="Path to the UTF-8 encoded text file to analyse")
     parser.add_argument(
-        "--output", required=True, help="Destination path for the generated single-quoted JSON lines"
+        "--output", required=True, help="Destination path for the generated triplets"
+    )
+    parser.add_argument(
+        "--format",
+        choices=_OUTPUT_FORMATS,
+        default=LEGACY_FORMAT,
+        help="Output format: single-quoted lines (default), JSONL, NumPy .npz or Parquet",
     )
     return parser.parse_args(argv)
 
 
 def main(argv: Optional[Sequence[str]] = None) -> None:
     args = parse_args(argv)
-    run(args.input, args.output)
+    run(args.input, args.output, output_format=args.format)
 
 
 if __name__ == "__main__":  # pragma: no cover - manual execution entry point
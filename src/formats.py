@@ -0,0 +1,177 @@
+"""Compact serialisation helpers for triplet collections."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+try:
+    import brotli
+except Exception:  # pragma: no cover - brotli is an optional accelerator
+    brotli = None
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover - numpy is only needed for .npz output
+    np = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except Exception:  # pragma: no cover - pyarrow is only needed for Parquet output
+    pa = None
+    pq = None
+
+
+TripletRecord = Mapping[str, object]
+
+COMPACT_FORMAT = "compact"
+LEGACY_FORMAT = "legacy"
+
+
+def encode_triplets(triplets: Iterable[TripletRecord]) -> Dict[str, Dict[str, List[object]]]:
+    """Dictionary-encode *triplets* into node and predicate tables plus edge arrays.
+
+    Every distinct entity (keyed by QID, falling back to its label) and every
+    distinct predicate is stored once; edges refer to them by integer index.
+    """
+
+    nodes: Dict[str, List[object]] = {"qid": [], "label": [], "type": []}
+    predicates: Dict[str, List[object]] = {"pid": [], "label": []}
+    edges: Dict[str, List[object]] = {"subject": [], "predicate": [], "object": []}
+
+    node_index: Dict[Tuple[str, str], int] = {}
+    predicate_index: Dict[Tuple[str, str], int] = {}
+
+    def _node(qid: str, label: str, type_: str) -> int:
+        # Tag the key so a QID-less label such as "Q145" cannot merge into a real QID.
+        key = ("qid", qid) if qid else ("label", label)
+        index = node_index.get(key)
+        if index is None:
+            index = len(nodes["qid"])
+            node_index[key] = index
+            nodes["qid"].append(qid)
+            nodes["label"].append(label)
+            nodes["type"].append(type_)
+        elif type_ and not nodes["type"][index]:
+            nodes["type"][index] = type_
+        return index
+
+    for record in triplets:
+        subject = _node(
+            _field(record, "subject_qid"),
+            _field(record, "subject"),
+            _field(record, "subject_type"),
+        )
+        obj = _node(
+            _field(record, "object_qid"),
+            _field(record, "object"),
+            _field(record, "object_type"),
+        )
+
+        predicate_key = (_field(record, "predicate_pid"), _field(record, "predicate"))
+        predicate = predicate_index.get(predicate_key)
+        if predicate is None:
+            predicate = len(predicates["pid"])
+            predicate_index[predicate_key] = predicate
+            predicates["pid"].append(predicate_key[0])
+            predicates["label"].append(predicate_key[1])
+
+        edges["subject"].append(subject)
+        edges["predicate"].append(predicate)
+        edges["object"].append(obj)
+
+    return {"nodes": nodes, "predicates": predicates, "edges": edges}
+
+
+def ensure_format_available(output_format: str) -> None:
+    """Raise ``ImportError`` if the optional dependency for *output_format* is missing."""
+
+    if output_format == "npz" and np is None:
+        raise ImportError("numpy is required for .npz output but is not installed.")
+    if output_format == "parquet" and (pa is None or pq is None):
+        raise ImportError("pyarrow is required for Parquet output but is not installed.")
+
+
+def write_jsonl(triplets: Iterable[TripletRecord], path: str, keys: Sequence[str]) -> None:
+    """Stream *triplets* to *path* as one JSON object per line."""
+
+    with Path(path).open("w", encoding="utf-8") as handle:
+        for record in triplets:
+            filtered = {key: _field(record, key) for key in keys}
+            handle.write(json.dumps(filtered, ensure_ascii=False))
+            handle.write("\n")
+
+
+def write_npz(triplets: Iterable[TripletRecord], path: str) -> None:
+    """Persist *triplets* as a compressed NumPy archive of node tables and edge lists."""
+
+    ensure_format_available("npz")
+
+    encoded = encode_triplets(triplets)
+    arrays = {}
+    for table in ("nodes", "predicates"):
+        for column, values in encoded[table].items():
+            arrays[f"{table}_{column}"] = np.array(values, dtype=str)
+    for column, values in encoded["edges"].items():
+        arrays[f"edges_{column}"] = np.array(values, dtype=np.int32)
+
+    # Write through a handle so numpy does not append a second ".npz" suffix.
+    with Path(path).open("wb") as handle:
+        np.savez_compressed(handle, **arrays)
+
+
+def write_parquet(triplets: Iterable[TripletRecord], path: str) -> None:
+    """Persist *triplets* as a Parquet table with dictionary-encoded columns."""
+
+    ensure_format_available("parquet")
+
+    encoded = encode_triplets(triplets)
+    nodes = encoded["nodes"]
+    predicates = encoded["predicates"]
+    edges = encoded["edges"]
+
+    def _column(indices: List[object], dictionary: List[object]) -> "pa.DictionaryArray":
+        return pa.DictionaryArray.from_arrays(
+            pa.array(indices, type=pa.int32()), pa.array(dictionary, type=pa.string())
+        )
+
+    table = pa.table(
+        {
+            "subject": _column(edges["subject"], nodes["label"]),
+            "subject_qid": _column(edges["subject"], nodes["qid"]),
+            "subject_type": _column(edges["subject"], nodes["type"]),
+            "predicate": _column(edges["predicate"], predicates["label"]),
+            "predicate_pid": _column(edges["predicate"], predicates["pid"]),
+            "object": _column(edges["object"], nodes["label"]),
+            "object_qid": _column(edges["object"], nodes["qid"]),
+            "object_type": _column(edges["object"], nodes["type"]),
+        }
+    )
+    pq.write_table(table, path, compression="zstd")
+
+
+def _field(record: TripletRecord, key: str) -> str:
+    # Treat a missing or None value as empty so the label fallback can apply.
+    value = record.get(key)
+    return "" if value is None else str(value)
+
+
+def supported_encodings() -> List[str]:
+    """Return the HTTP content codings available, most preferred first."""
+
+    return ["br", "gzip"] if brotli is not None else ["gzip"]
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress *body* with the named HTTP content *encoding*."""
+
+    if encoding == "br":
+        if brotli is None:
+            raise ImportError("brotli is required for 'br' encoding but is not installed.")
+        return brotli.compress(body, quality=5)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    raise ValueError(f"Unsupported content encoding: {encoding!r}")
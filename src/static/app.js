@@ -7,7 +7,16 @@
   const graphEl = document.getElementById("graph");
   const emptyState = document.getElementById("graph-empty");
 
+  const layoutWorkerUrl = new URL("layout-worker.js", document.currentScript.src);
+
+  // Above these sizes the layout runs in a Web Worker and styling is simplified.
+  const LARGE_GRAPH_NODES = 150;
+  const LARGE_GRAPH_EDGES = 300;
+
   let cy = null;
+  let cyLarge = false;
+  let layoutWorker = null;
+  let layoutToken = 0;
   let latestTriplets = [];
 
   function getCssColor(variableName, fallback) {
@@ -40,17 +49,22 @@
     return `${name}\n${typeLabel}`;
   }
 
-  function destroyGraph() {
+  function clearGraph() {
+    cancelLayout();
     if (cy) {
-      cy.destroy();
-      cy = null;
-    }
-    if (graphEl) {
-      graphEl.innerHTML = "";
+      cy.elements().remove();
     }
     setExportAvailability(false);
   }
 
+  function cancelLayout() {
+    layoutToken += 1;
+    if (layoutWorker) {
+      layoutWorker.terminate();
+      layoutWorker = null;
+    }
+  }
+
   function buildElements(triplets) {
     const nodesMap = new Map();
     const edges = [];
@@ -103,8 +117,10 @@
       return { name: "grid", fit: true, padding: 50 };
     }
     if (nodesCount <= 4) {
-      return { name: "circle", fit: true, padding: 50 }; 
+      return { name: "circle", fit: true, padding: 50 };
     }
+    // cose is quadratic per iteration, so fewer iterations as the graph grows.
+    const numIter = Math.max(200, Math.min(1200, Math.round(60000 / nodesCount)));
     return {
       name: "cose",
       animate: false,
@@ -114,21 +130,151 @@
       idealEdgeLength: 160,
       nodeOverlap: 16,
       gravity: 0.8,
-      numIter: 1200,
+      numIter,
       initialTemp: 1000,
       coolingFactor: 0.99,
       minTemp: 1.0,
     };
   }
 
+  function workerIterationsFor(nodesCount) {
+    return Math.max(60, Math.min(400, Math.round(80000 / nodesCount)));
+  }
+
+  function isLargeGraph(nodesCount, edgesCount) {
+    return nodesCount > LARGE_GRAPH_NODES || edgesCount > LARGE_GRAPH_EDGES;
+  }
+
+  function graphStyle(large) {
+    const edgeColor = getCssColor("--edge", "#facc15");
+    return [
+      {
+        selector: "node",
+        style: {
+          width: large ? 36 : 84,
+          height: large ? 36 : 84,
+          "background-color": "data(color)",
+          "border-width": large ? 1 : 2,
+          "border-color": "rgba(14, 116, 144, 0.55)",
+          label: large ? "data(label)" : "data(displayLabel)",
+          color: "#e2e8f0",
+          "text-wrap": "wrap",
+          "text-max-width": 90,
+          "text-valign": large ? "bottom" : "center",
+          "text-halign": "center",
+          "font-size": large ? 10 : 12,
+          "font-weight": 600,
+          "text-outline-color": "rgba(15, 23, 42, 0.7)",
+          "text-outline-width": large ? 2 : 3,
+          "line-height": 1.2,
+          "min-zoomed-font-size": large ? 8 : 0,
+        },
+      },
+      {
+        selector: "edge",
+        style: {
+          width: large ? 1 : 2,
+          // Haystack edges skip per-edge bezier routing, which dominates redraws.
+          "curve-style": large ? "haystack" : "bezier",
+          "haystack-radius": 0,
+          "line-color": edgeColor,
+          "target-arrow-color": edgeColor,
+          "target-arrow-shape": large ? "none" : "triangle",
+          "arrow-scale": 1.1,
+          label: "data(label)",
+          "font-size": 11,
+          color: edgeColor,
+          "text-background-color": "rgba(15, 23, 42, 0.75)",
+          "text-background-opacity": 0.9,
+          "text-background-padding": 3,
+          "text-background-shape": "roundrectangle",
+          "text-rotation": "autorotate",
+          // Edge labels disappear once the rendered font drops below this size.
+          "min-zoomed-font-size": large ? 14 : 9,
+        },
+      },
+    ];
+  }
+
+  function ensureGraph(large) {
+    if (cy && cyLarge === large) {
+      return cy;
+    }
+    if (cy) {
+      cy.destroy();
+      cy = null;
+    }
+    if (graphEl) {
+      graphEl.innerHTML = "";
+    }
+
+    cyLarge = large;
+    cy = cytoscape({
+      container: graphEl,
+      elements: [],
+      minZoom: large ? 0.05 : 0.4,
+      maxZoom: 1.8,
+      wheelSensitivity: 0.2,
+      autoungrabify: false,
+      autounselectify: false,
+      // Renderer shortcuts that keep panning and zooming smooth on big graphs.
+      hideEdgesOnViewport: large,
+      textureOnViewport: large,
+      pixelRatio: large ? 1 : "auto",
+      style: graphStyle(large),
+    });
+    return cy;
+  }
+
+  function runWorkerLayout(nodes, edges) {
+    const token = layoutToken;
+    const indexById = new Map();
+    const nodeIds = nodes.map((node, index) => {
+      indexById.set(node.data.id, index);
+      return node.data.id;
+    });
+    const edgePairs = edges.map((edge) => [
+      indexById.get(edge.data.source),
+      indexById.get(edge.data.target),
+    ]);
+
+    layoutWorker = new Worker(layoutWorkerUrl);
+    layoutWorker.onmessage = (event) => {
+      if (token !== layoutToken || !cy) {
+        return;
+      }
+      layoutWorker.terminate();
+      layoutWorker = null;
+      cy.layout({
+        name: "preset",
+        positions: event.data.positions,
+        fit: true,
+        padding: 40,
+      }).run();
+      setExportAvailability(true);
+    };
+    layoutWorker.onerror = (err) => {
+      console.error("Layout worker failed", err);
+      if (token === layoutToken && cy) {
+        cancelLayout();
+        cy.layout({ name: "grid", fit: true, padding: 40 }).run();
+        setExportAvailability(true);
+      }
+    };
+    layoutWorker.postMessage({
+      nodeIds,
+      edges: edgePairs,
+      iterations: workerIterationsFor(nodes.length),
+    });
+  }
+
   function renderGraph(triplets) {
     latestTriplets = Array.isArray(triplets) ? triplets : [];
 
-    destroyGraph();
+    clearGraph();
 
     if (!latestTriplets.length) {
       emptyState.hidden = false;
-      setExportAvailability(false);
       return;
     }
 
@@ -140,64 +286,25 @@
     }
 
     const { nodes, edges } = buildElements(latestTriplets);
+    const large = isLargeGraph(nodes.length, edges.length);
 
-    cy = cytoscape({
-      container: graphEl,
-      elements: [...nodes, ...edges],
-      minZoom: 0.4,
-      maxZoom: 1.8,
-      wheelSensitivity: 0.2,
-      autoungrabify: false,
-      autounselectify: false,
-      style: [
-        {
-          selector: "node",
-          style: {
-            width: 84,
-            height: 84,
-            "background-color": "data(color)",
-            "border-width": 2,
-            "border-color": "rgba(14, 116, 144, 0.55)",
-            label: "data(displayLabel)",
-            color: "#e2e8f0",
-            "text-wrap": "wrap",
-            "text-max-width": 90,
-            "text-valign": "center",
-            "text-halign": "center",
-            "font-size": 12,
-            "font-weight": 600,
-            "text-outline-color": "rgba(15, 23, 42, 0.7)",
-            "text-outline-width": 3,
-            "line-height": 1.2,
-          },
-        },
-        {
-          selector: "edge",
-          style: {
-            width: 2,
-            "curve-style": "bezier",
-            "line-color": getCssColor("--edge", "#facc15"),
-            "target-arrow-color": getCssColor("--edge", "#facc15"),
-            "target-arrow-shape": "triangle",
-            "arrow-scale": 1.1,
-            label: "data(label)",
-            "font-size": 11,
-            color: getCssColor("--edge", "#facc15"),
-            "text-background-color": "rgba(15, 23, 42, 0.75)",
-            "text-background-opacity": 0.9,
-            "text-background-padding": 3,
-            "text-background-shape": "roundrectangle",
-            "text-rotation": "autorotate"
-          },
-        },
-      ],
+    ensureGraph(large);
+    cy.batch(() => {
+      cy.add(nodes);
+      cy.add(edges);
     });
 
-    const layout = layoutFor(nodes.length);
-    cy.layout(layout).run();
-    cy.center();
-    cy.fit(null, 40);
-    setExportAvailability(true);
+    if (large && typeof Worker !== "undefined") {
+      // Cheap placeholder positions until the worker reports back.
+      cy.layout({ name: "grid", fit: true, padding: 40 }).run();
+      // Export is enabled by the worker handlers once the real layout lands.
+      runWorkerLayout(nodes, edges);
+    } else {
+      cy.layout(layoutFor(nodes.length)).run();
+      cy.center();
+      cy.fit(null, 40);
+      setExportAvailability(true);
+    }
   }
 
   function setExportAvailability(enabled) {
@@ -213,7 +320,8 @@
 
     try {
       const background = getCssColor("--bg", "#0f172a");
-      const dataUrl = cy.png({ full: true, scale: 2, bg: background || "#0f172a" });
+      const scale = cyLarge ? 1 : 2;
+      const dataUrl = cy.png({ full: true, scale, bg: background || "#0f172a" });
       const link = document.createElement("a");
       const timestamp = new Date().toISOString().replace(/[:.]/g, "-");
       link.href = dataUrl;
@@ -0,0 +1,110 @@
+// Force-directed layout run off the main thread for large graphs.
+//
+// Receives { nodeIds, edges: [[sourceIndex, targetIndex], ...], iterations }
+// and replies with { positions: { [id]: { x, y } } }. Repulsion is only
+// computed between nodes in neighbouring grid cells so each iteration stays
+// close to linear in the number of nodes.
+self.onmessage = function (event) {
+  const { nodeIds, edges, iterations } = event.data;
+  const count = nodeIds.length;
+  const idealLength = 120;
+  const area = count * idealLength * idealLength;
+  const side = Math.sqrt(area);
+  const k = Math.sqrt(area / Math.max(count, 1));
+  const k2 = k * k;
+  const cellSize = 2 * k;
+
+  const xs = new Float64Array(count);
+  const ys = new Float64Array(count);
+  const dx = new Float64Array(count);
+  const dy = new Float64Array(count);
+
+  // Seed on a spiral so the result is deterministic for identical input.
+  for (let i = 0; i < count; i += 1) {
+    const angle = i * 2.399963;
+    const radius = (side / 2) * Math.sqrt((i + 0.5) / count);
+    xs[i] = radius * Math.cos(angle);
+    ys[i] = radius * Math.sin(angle);
+  }
+
+  let temperature = side / 10;
+  const cooling = temperature / (iterations + 1);
+
+  for (let iter = 0; iter < iterations; iter += 1) {
+    dx.fill(0);
+    dy.fill(0);
+
+    const grid = new Map();
+    for (let i = 0; i < count; i += 1) {
+      const key = `${Math.floor(xs[i] / cellSize)},${Math.floor(ys[i] / cellSize)}`;
+      const bucket = grid.get(key);
+      if (bucket) {
+        bucket.push(i);
+      } else {
+        grid.set(key, [i]);
+      }
+    }
+
+    for (let i = 0; i < count; i += 1) {
+      const cx = Math.floor(xs[i] / cellSize);
+      const cy = Math.floor(ys[i] / cellSize);
+      for (let gx = cx - 1; gx <= cx + 1; gx += 1) {
+        for (let gy = cy - 1; gy <= cy + 1; gy += 1) {
+          const bucket = grid.get(`${gx},${gy}`);
+          if (!bucket) {
+            continue;
+          }
+          for (const j of bucket) {
+            if (j <= i) {
+              continue;
+            }
+            let ddx = xs[i] - xs[j];
+            let ddy = ys[i] - ys[j];
+            let distSq = ddx * ddx + ddy * ddy;
+            if (distSq < 0.01) {
+              ddx = 0.1 * ((i % 7) - 3 || 1);
+              ddy = 0.1 * ((j % 5) - 2 || 1);
+              distSq = ddx * ddx + ddy * ddy;
+            }
+            const force = k2 / distSq;
+            dx[i] += ddx * force;
+            dy[i] += ddy * force;
+            dx[j] -= ddx * force;
+            dy[j] -= ddy * force;
+          }
+        }
+      }
+    }
+
+    for (const [source, target] of edges) {
+      const ddx = xs[source] - xs[target];
+      const ddy = ys[source] - ys[target];
+      const dist = Math.sqrt(ddx * ddx + ddy * ddy) || 0.01;
+      const force = dist / k;
+      dx[source] -= ddx * force;
+      dy[source] -= ddy * force;
+      dx[target] += ddx * force;
+      dy[target] += ddy * force;
+    }
+
+    for (let i = 0; i < count; i += 1) {
+      // Mild gravity keeps disconnected components from drifting apart.
+      dx[i] -= xs[i] * 0.01;
+      dy[i] -= ys[i] * 0.01;
+      const length = Math.sqrt(dx[i] * dx[i] + dy[i] * dy[i]);
+      if (length > 0) {
+        const step = Math.min(length, temperature);
+        xs[i] += (dx[i] / length) * step;
+        ys[i] += (dy[i] / length) * step;
+      }
+    }
+
+    temperature = Math.max(temperature - cooling, 1);
+  }
+
+  const positions = {};
+  for (let i = 0; i < count; i += 1) {
+    positions[nodeIds[i]] = { x: xs[i], y: ys[i] };
+  }
+  self.postMessage({ positions });
+};
@@ -0,0 +1,60 @@
+from typing import Callable, Dict, Iterable, List
+
+import pytest
+
+
+_SAMPLE_TRIPLETS = [
+    {
+        "subject": "Alan Turing",
+        "subject_qid": "Q7251",
+        "subject_type": "human",
+        "predicate": "citizenship",
+        "predicate_pid": "P27",
+        "object": "United Kingdom",
+        "object_qid": "Q145",
+        "object_type": "country",
+    },
+    {
+        "subject": "Alan Turing",
+        "subject_qid": "Q7251",
+        "subject_type": "human",
+        "predicate": "educated at",
+        "predicate_pid": "P69",
+        "object": "King's College",
+        "object_qid": "Q924289",
+        "object_type": "organization",
+    },
+]
+
+
+class StubPipeline:
+    def __init__(self, triplets: Iterable[Dict[str, str]]):
+        self.triplets = [dict(record) for record in triplets]
+        self.observed = None
+
+    def generate_triplets(self, text: str):
+        self.observed = text
+        return [dict(record) for record in self.triplets]
+
+
+@pytest.fixture
+def sample_triplets() -> List[Dict[str, str]]:
+    return [dict(record) for record in _SAMPLE_TRIPLETS]
+
+
+@pytest.fixture
+def make_triplets() -> Callable[[int], List[Dict[str, str]]]:
+    """Build *count* citizenship triplets with distinct subjects from the sample shape."""
+
+    def _make(count: int) -> List[Dict[str, str]]:
+        return [
+            dict(_SAMPLE_TRIPLETS[0], subject=f"Person {index}", subject_qid=f"Q{index}")
+            for index in range(1, count + 1)
+        ]
+
+    return _make
+
+
+@pytest.fixture
+def stub_pipeline() -> Callable[[Iterable[Dict[str, str]]], StubPipeline]:
+    return StubPipeline
@@ -0,0 +1,100 @@
+import gzip
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    import src.app as app_module
+except ModuleNotFoundError as exc:  # pragma: no cover - ensures useful failure message early
+    raise AssertionError(
+        "Expected `src.app` module exposing a `create_app` factory for the Flask application."
+    ) from exc
+
+
+@pytest.fixture
+def make_client(monkeypatch, make_triplets, stub_pipeline):
+    def _make(count: int):
+        monkeypatch.setattr(app_module, "_pipeline", stub_pipeline(make_triplets(count)))
+        return app_module.create_app().test_client()
+
+    return _make
+
+
+def test_large_response_is_gzip_compressed(make_client):
+    client = make_client(50)
+
+    response = client.post("/api/triplets", json={"text": "x"}, headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    body = gzip.decompress(response.data)
+    assert len(body) >= 1024
+    assert b'"Person 50"' in body
+
+
+def test_brotli_is_preferred_when_available(make_client):
+    brotli = pytest.importorskip("brotli")
+    client = make_client(50)
+
+    response = client.post(
+        "/api/triplets", json={"text": "x"}, headers={"Accept-Encoding": "gzip, br"}
+    )
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert b'"Person 50"' in brotli.decompress(response.data)
+
+
+def test_small_response_is_not_compressed(make_client):
+    client = make_client(1)
+
+    response = client.post("/api/triplets", json={"text": "x"}, headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert response.get_json()["triplets"][0]["subject"] == "Person 1"
+
+
+def test_response_is_not_compressed_without_accept_encoding(make_client):
+    client = make_client(50)
+
+    response = client.post("/api/triplets", json={"text": "x"}, headers={"Accept-Encoding": "identity"})
+
+    assert "Content-Encoding" not in response.headers
+    assert len(response.get_json()["triplets"]) == 50
+
+
+def test_compact_format_returns_node_and_edge_tables(make_client):
+    client = make_client(2)
+
+    response = client.post("/api/triplets", json={"text": "x", "format": "compact"})
+
+    assert response.status_code == 200
+    assert response.get_json() == {
+        "nodes": {
+            "qid": ["Q1", "Q145", "Q2"],
+            "label": ["Person 1", "United Kingdom", "Person 2"],
+            "type": ["human", "country", "human"],
+        },
+        "predicates": {"pid": ["P27"], "label": ["citizenship"]},
+        "edges": {"subject": [0, 2], "predicate": [0, 0], "object": [1, 1]},
+    }
+
+
+def test_unknown_format_is_rejected_uncompressed(make_client, monkeypatch):
+    # Drop the size threshold so only the status check keeps the error uncompressed.
+    monkeypatch.setattr(app_module, "_COMPRESS_MIN_BYTES", 0)
+    client = make_client(50)
+
+    response = client.post(
+        "/api/triplets", json={"text": "x", "format": "xml"}, headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 400
+    assert "Content-Encoding" not in response.headers
+    assert response.get_json()["triplets"] == []
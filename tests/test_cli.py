@@ -1,4 +1,5 @@
 import ast
+import json
 import sys
 from pathlib import Path
 
@@ -73,3 +74,72 @@ def test_run_writes_expected_json_lines(tmp_path: Path):
     assert parsed["predicate"] == "citizenship"
     assert "subject_type" not in parsed
     assert "object_type" not in parsed
+
+
+def test_run_writes_streaming_jsonl(tmp_path: Path, sample_triplets, stub_pipeline):
+    input_path = tmp_path / "input.txt"
+    output_path = tmp_path / "output.jsonl"
+    input_path.write_text("Alan Turing", encoding="utf-8")
+
+    run(str(input_path), str(output_path), pipeline=stub_pipeline(sample_triplets), output_format="jsonl")
+
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    parsed = [json.loads(line) for line in lines]
+    assert parsed[1]["object"] == "King's College"
+    assert "subject_type" not in parsed[0]
+
+
+def test_run_writes_empty_string_for_missing_qid_in_jsonl(
+    tmp_path: Path, sample_triplets, stub_pipeline
+):
+    input_path = tmp_path / "input.txt"
+    output_path = tmp_path / "output.jsonl"
+    input_path.write_text("Alan Turing", encoding="utf-8")
+    sample_triplets[0]["subject_qid"] = None
+
+    run(
+        str(input_path),
+        str(output_path),
+        pipeline=stub_pipeline(sample_triplets[:1]),
+        output_format="jsonl",
+    )
+
+    parsed = json.loads(output_path.read_text(encoding="utf-8"))
+    assert parsed["subject_qid"] == ""
+
+
+def test_run_rejects_unknown_format(tmp_path: Path, sample_triplets, stub_pipeline):
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("Alan Turing", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        run(str(input_path), str(tmp_path / "out"), pipeline=stub_pipeline(sample_triplets), output_format="xml")
+
+
+def test_run_checks_optional_dependency_before_pipeline(tmp_path: Path, monkeypatch):
+    import src.formats
+
+    monkeypatch.setattr(src.formats, "np", None)
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("Alan Turing", encoding="utf-8")
+
+    class ExplodingPipeline:
+        def generate_triplets(self, text: str):
+            raise AssertionError("pipeline should not run when the writer is unavailable")
+
+    with pytest.raises(ImportError):
+        run(str(input_path), str(tmp_path / "out.npz"), pipeline=ExplodingPipeline(), output_format="npz")
+
+
+def test_run_writes_npz_edge_list(tmp_path: Path, sample_triplets, stub_pipeline):
+    np = pytest.importorskip("numpy")
+    input_path = tmp_path / "input.txt"
+    output_path = tmp_path / "output.npz"
+    input_path.write_text("Alan Turing", encoding="utf-8")
+
+    run(str(input_path), str(output_path), pipeline=stub_pipeline(sample_triplets), output_format="npz")
+
+    with np.load(output_path) as archive:
+        assert list(archive["nodes_label"]) == ["Alan Turing", "United Kingdom", "King's College"]
+        assert list(archive["edges_object"]) == [1, 2]
@@ -0,0 +1,59 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+try:
+    from src.formats import encode_triplets, write_parquet
+except ModuleNotFoundError as exc:  # pragma: no cover - ensures useful failure message early
+    raise AssertionError(
+        "Expected `src.formats` module exposing `encode_triplets` and the columnar writers."
+    ) from exc
+
+
+def test_encode_triplets_deduplicates_nodes(sample_triplets):
+    encoded = encode_triplets(sample_triplets)
+
+    assert encoded["nodes"]["qid"] == ["Q7251", "Q145", "Q924289"]
+    assert encoded["nodes"]["type"] == ["human", "country", "organization"]
+    assert encoded["predicates"]["pid"] == ["P27", "P69"]
+    assert encoded["edges"] == {"subject": [0, 0], "predicate": [0, 1], "object": [1, 2]}
+
+
+def test_encode_triplets_falls_back_to_label_when_qid_is_none():
+    triplets = [
+        {"subject": "Ada", "subject_qid": None, "predicate": "knows", "object": "Charles", "object_qid": None},
+        {"subject": "Grace", "subject_qid": None, "predicate": "knows", "object": "Charles", "object_qid": None},
+    ]
+
+    encoded = encode_triplets(triplets)
+
+    assert encoded["nodes"]["label"] == ["Ada", "Charles", "Grace"]
+    assert encoded["nodes"]["qid"] == ["", "", ""]
+    assert encoded["edges"]["object"] == [1, 1]
+
+
+def test_encode_triplets_keeps_label_keys_apart_from_qids():
+    triplets = [
+        {"subject": "Q145", "subject_qid": None, "predicate": "mentions", "object": "United Kingdom", "object_qid": "Q145"},
+    ]
+
+    encoded = encode_triplets(triplets)
+
+    assert encoded["nodes"]["qid"] == ["", "Q145"]
+    assert encoded["nodes"]["label"] == ["Q145", "United Kingdom"]
+    assert encoded["edges"]["subject"] == [0]
+    assert encoded["edges"]["object"] == [1]
+
+
+def test_write_parquet_round_trips_rows(tmp_path: Path, sample_triplets):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output_path = tmp_path / "triplets.parquet"
+
+    write_parquet(sample_triplets, str(output_path))
+
+    assert pq.read_table(output_path).to_pylist() == sample_triplets